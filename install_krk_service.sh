@@ -15,6 +15,8 @@ mkdir -p "$SERVICE_DIR"
 
 # Copy files
 cp krk_anti_shutoff.py "$SERVICE_DIR/"
+cp krk_coordination.py "$SERVICE_DIR/"
+cp krk_watchdog.py "$SERVICE_DIR/"
 cp requirements.txt "$SERVICE_DIR/"
 
 # Create virtual environment and install dependencies
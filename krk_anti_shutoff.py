@@ -15,15 +15,19 @@ import argparse
 import signal
 import sys
 from datetime import datetime
+from krk_coordination import open_coordinator
+from krk_watchdog import ResourceWatchdog
 
 class KRKAntiShutoff:
-    def __init__(self, frequency=50, duration=3.0, interval=25*60, volume=0.8):
+    def __init__(self, frequency=50, duration=3.0, interval=25*60, volume=0.8, coordinate=True, watchdog=None):
         """
         Args:
             frequency (int): Tone frequency in Hz (50Hz is inaudible, based on original Reddit hack)
             duration (float): Tone duration in seconds (3.0s for reliable wake-up)
             interval (int): Interval between tones in seconds (25 min default)
             volume (float): Tone volume (0.8 default - higher volume for reliable wake-up)
+            coordinate (bool): Share the tone schedule with other running instances
+            watchdog (ResourceWatchdog): Optional resource watchdog started with run()
         """
         self.frequency = frequency
         self.duration = duration
@@ -31,6 +35,8 @@ class KRKAntiShutoff:
         self.volume = volume
         self.running = True
         self.sample_rate = 44100
+        self.coordinator = open_coordinator() if coordinate else None
+        self.watchdog = watchdog
         
         # Configure signal handling for clean exit
         signal.signal(signal.SIGINT, self.signal_handler)
@@ -40,6 +46,8 @@ class KRKAntiShutoff:
         """Handles interrupt signal for clean exit"""
         print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Stopping KRK Anti-Shutoff...")
         self.running = False
+        if self.watchdog:
+            self.watchdog.stop()
         sys.exit(0)
     
     def generate_tone(self):
@@ -68,22 +76,50 @@ class KRKAntiShutoff:
         print(f"   Duration: {self.duration}s")
         print(f"   Interval: {self.interval//60} minutes")
         print(f"   Volume: {self.volume}")
+        print(f"   Coordination: {'shared with other instances' if self.coordinator else 'off'}")
+        if self.watchdog:
+            print(f"   Watchdog: every {self.watchdog.interval//60} minutes -> {self.watchdog.log.path}")
         print("   Press Ctrl+C to stop\n")
         
+        if self.watchdog:
+            self.watchdog.start()
+        
         while self.running:
             current_time = datetime.now().strftime('%H:%M:%S')
+            
+            # Skip this slot if another instance is due first or already played
+            if self.coordinator:
+                should_play, wait = self.coordinator.claim(self.duration)
+                if not should_play:
+                    owner, _, _ = self.coordinator.status()
+                    print(f"[{current_time}] 🔁 Tone handled by another instance (PID {owner}), "
+                          f"next check in {int(wait)//60}:{int(wait)%60:02d}\n")
+                    time.sleep(wait)
+                    continue
+            
             print(f"[{current_time}] Playing inaudible tone to keep KRK monitors active...")
             
             if self.play_tone():
                 print(f"[{current_time}] ✅ Tone played successfully")
+                if self.coordinator:
+                    self.coordinator.commit(self.interval)
             else:
                 print(f"[{current_time}] ❌ Error playing tone")
+                if self.coordinator:
+                    self.coordinator.release()
             
             print(f"[{current_time}] 💤 Waiting {self.interval//60} minutes until next tone...\n")
             
             # Wait for specified interval
             time.sleep(self.interval)
 
+def positive_int(value):
+    """argparse type for options that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1 (got {value})")
+    return number
+
 def main():
     parser = argparse.ArgumentParser(description='KRK Rokit Anti-Shutoff Script')
     parser.add_argument('-f', '--frequency', type=int, default=50,
@@ -96,17 +132,31 @@ def main():
                        help='Tone volume (default: 0.8 - higher volume for reliable wake-up)')
     parser.add_argument('--test', action='store_true',
                        help='Test mode: play one tone and exit')
+    parser.add_argument('--no-coordinate', action='store_true',
+                       help='Do not share the tone schedule with other running instances')
+    parser.add_argument('--watchdog', action='store_true',
+                       help='Monitor memory, file descriptors and threads; restart when over limits')
+    parser.add_argument('--watchdog-interval', type=positive_int, default=10,
+                       help='Watchdog sampling interval in minutes (default: 10)')
+    parser.add_argument('--max-rss', type=positive_int, default=200,
+                       help='Watchdog memory limit in MB (default: 200)')
     
     args = parser.parse_args()
     
     # Convert interval from minutes to seconds
     interval_seconds = args.interval * 60
     
+    watchdog = None
+    if args.watchdog and not args.test:
+        watchdog = ResourceWatchdog(interval=args.watchdog_interval * 60, max_rss_mb=args.max_rss)
+    
     anti_shutoff = KRKAntiShutoff(
         frequency=args.frequency,
         duration=args.duration,
         interval=interval_seconds,
-        volume=args.volume
+        volume=args.volume,
+        coordinate=not args.no_coordinate and not args.test,
+        watchdog=watchdog
     )
     
     if args.test:
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+KRK Rokit Anti-Shutoff Cross-Process Coordination
+Lets several running instances (launchd CLI service, menubar apps) share one tone schedule,
+so only the first instance that is due plays the tone and the others wait for the next deadline.
+
+State lives in a small memory-mapped record guarded by an flock() on the same file:
+    owner PID, last tone time, next deadline, lease expiry, interval of the writer
+"""
+
+import fcntl
+import mmap
+import os
+import struct
+import time
+from contextlib import contextmanager
+
+STATE_DIR = os.path.expanduser("~/.krk_anti_shutoff")
+STATE_FILE = os.path.join(STATE_DIR, "tone_state.mmap")
+
+# magic, owner pid, last tone time, next deadline, lease expiry, writer's interval
+STATE_FORMAT = struct.Struct("<4sqdddd")
+STATE_MAGIC = b"KRK2"
+
+# Extra seconds on top of the tone duration before a playing owner is considered stale
+LEASE_GRACE = 10.0
+
+
+def pid_alive(pid):
+    """Returns True if a process with the given PID exists"""
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class ToneCoordinator:
+    def __init__(self, path=STATE_FILE):
+        """
+        Args:
+            path (str): Shared state file (created on first use)
+        """
+        self.path = path
+        self.pid = os.getpid()
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        with self._locked():
+            if os.fstat(self.fd).st_size < STATE_FORMAT.size:
+                os.ftruncate(self.fd, STATE_FORMAT.size)
+        self.map = mmap.mmap(self.fd, STATE_FORMAT.size)
+
+    def close(self):
+        """Releases the mapping and file descriptor"""
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+    @contextmanager
+    def _locked(self):
+        """Holds the exclusive cross-process lock"""
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+    def _read(self):
+        """Reads (owner_pid, last_tone, next_deadline, lease_until, interval); caller holds the lock"""
+        magic, owner, last_tone, deadline, lease, interval = STATE_FORMAT.unpack_from(self.map, 0)
+        if magic != STATE_MAGIC:
+            return 0, 0.0, 0.0, 0.0, 0.0
+        return owner, last_tone, deadline, lease, interval
+
+    def _write(self, owner, last_tone, deadline, lease, interval):
+        """Writes the state record; caller holds the lock"""
+        STATE_FORMAT.pack_into(self.map, 0, STATE_MAGIC, owner, last_tone, deadline, lease, interval)
+        self.map.flush()
+
+    def claim(self, duration):
+        """
+        Tries to take the next tone slot.
+
+        Args:
+            duration (float): Tone duration in seconds, used to size the playback lease
+
+        Returns:
+            tuple: (should_play, wait_seconds). When should_play is False, wait_seconds is the
+                   time until the shared deadline (or until another owner's lease expires).
+        """
+        now = time.time()
+        with self._locked():
+            owner, last_tone, deadline, lease, interval = self._read()
+
+            # Another live instance is playing right now
+            if lease > now and owner != self.pid and pid_alive(owner):
+                return False, lease - now
+
+            # Not due yet; a deadline beyond the writer's own interval, or a last tone in the
+            # future, means the clock was changed and the record can't be trusted
+            if now < deadline <= now + interval and last_tone <= now:
+                return False, deadline - now
+
+            # Due, or the previous owner died mid-lease: take over
+            self._write(self.pid, last_tone, deadline, now + duration + LEASE_GRACE, interval)
+            return True, 0.0
+
+    def commit(self, interval):
+        """
+        Records a successful tone and schedules the next shared deadline.
+
+        Returns:
+            float: Next deadline (epoch seconds)
+        """
+        now = time.time()
+        with self._locked():
+            self._write(self.pid, now, now + interval, 0.0, interval)
+        return now + interval
+
+    def release(self):
+        """Gives up the lease after a failed tone so another instance can try right away"""
+        with self._locked():
+            owner, last_tone, deadline, lease, interval = self._read()
+            if owner == self.pid:
+                self._write(self.pid, last_tone, deadline, 0.0, interval)
+
+    def status(self):
+        """
+        Returns:
+            tuple: (owner_pid, last_tone, next_deadline) from the shared record
+        """
+        with self._locked():
+            owner, last_tone, deadline, lease, interval = self._read()
+        return owner, last_tone, deadline
+
+
+def open_coordinator():
+    """Opens the shared coordinator, or returns None if the state file is unavailable"""
+    try:
+        return ToneCoordinator()
+    except OSError as e:
+        print(f"Coordination disabled (could not open {STATE_FILE}): {e}")
+        return None
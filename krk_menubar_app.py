@@ -10,6 +10,7 @@ import sounddevice as sd
 import threading
 import time
 from datetime import datetime, timedelta
+from krk_coordination import open_coordinator
 
 class KRKMenuBarApp(rumps.App):
     def __init__(self):
@@ -28,6 +29,9 @@ class KRKMenuBarApp(rumps.App):
         self.volume = 0.8
         self.sample_rate = 44100
         
+        # Shared schedule so concurrent instances never double-play
+        self.coordinator = open_coordinator()
+        
         # App state
         self.is_running = False
         self.worker_thread = None
@@ -85,20 +89,33 @@ class KRKMenuBarApp(rumps.App):
         """Main worker function that runs in background thread"""
         while self.is_running:
             current_time = datetime.now()
+            wait = self.interval
             
-            # Play tone
-            success = self.play_tone()
+            # Let the first instance that is due play; the others follow the shared deadline
+            should_play = True
+            if self.coordinator:
+                should_play, shared_wait = self.coordinator.claim(self.duration)
+                if not should_play:
+                    wait = int(shared_wait) + 1
             
-            if success:
-                print(f"[{current_time.strftime('%H:%M:%S')}] ✅ Tone played successfully")
-            else:
-                print(f"[{current_time.strftime('%H:%M:%S')}] ❌ Error playing tone")
+            if should_play:
+                # Play tone
+                success = self.play_tone()
+                
+                if success:
+                    print(f"[{current_time.strftime('%H:%M:%S')}] ✅ Tone played successfully")
+                    if self.coordinator:
+                        self.coordinator.commit(self.interval)
+                else:
+                    print(f"[{current_time.strftime('%H:%M:%S')}] ❌ Error playing tone")
+                    if self.coordinator:
+                        self.coordinator.release()
             
             # Calculate next tone time
-            self.next_tone_time = current_time + timedelta(seconds=self.interval)
+            self.next_tone_time = current_time + timedelta(seconds=wait)
             
-            # Wait for specified interval (but check every second if we should stop)
-            for _ in range(self.interval):
+            # Wait until next tone (but check every second if we should stop)
+            for _ in range(wait):
                 if not self.is_running:
                     break
                 time.sleep(1)
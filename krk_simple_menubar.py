@@ -12,6 +12,8 @@ import time
 import os
 import sys
 from datetime import datetime, timedelta
+from krk_coordination import open_coordinator
+from krk_watchdog import ResourceWatchdog, restart_process
 
 class KRKSimpleApp(rumps.App):
     def __init__(self):
@@ -23,6 +25,13 @@ class KRKSimpleApp(rumps.App):
         self.interval = 25 * 60  # 25 minutes
         self.volume = 0.8
         self.sample_rate = 44100
+        self.coordinator = open_coordinator()
+        
+        # Optional resource watchdog (enable with KRK_WATCHDOG=1)
+        self.watchdog = None
+        if os.environ.get("KRK_WATCHDOG") == "1":
+            self.watchdog = ResourceWatchdog(on_restart=self.watchdog_restart)
+            self.watchdog.start()
         
         # State
         self.is_running = False
@@ -38,6 +47,10 @@ class KRKSimpleApp(rumps.App):
         
         # Auto-start protection
         rumps.notification("KRK Anti-Shutoff", "Started", "Ready to protect your monitors! 🎵")
+        
+        # Resume protection if the watchdog restarted us while it was running
+        if os.environ.pop("KRK_RESUME_PROTECTION", None) == "1":
+            self.start_protection(None)
     
     def setup_menu(self):
         """Setup menu items"""
@@ -101,8 +114,18 @@ class KRKSimpleApp(rumps.App):
     def quit_app(self, _):
         """Quit app"""
         self.is_running = False
+        if self.watchdog:
+            self.watchdog.stop()
         rumps.quit_application()
     
+    def watchdog_restart(self):
+        """Restart from the watchdog, keeping protection on if it was running"""
+        if self.is_running:
+            os.environ["KRK_RESUME_PROTECTION"] = "1"
+        else:
+            os.environ.pop("KRK_RESUME_PROTECTION", None)
+        restart_process()
+    
     def play_tone(self):
         """Play the tone"""
         try:
@@ -119,18 +142,32 @@ class KRKSimpleApp(rumps.App):
     def worker_loop(self):
         """Main protection loop"""
         while self.is_running:
-            # Play tone
             current_time = datetime.now()
-            success = self.play_tone()
+            wait = self.interval
             
-            if success:
-                print(f"[{current_time.strftime('%H:%M:%S')}] ✅ Tone played")
+            # Skip if another instance is due first (shared schedule)
+            should_play = True
+            if self.coordinator:
+                should_play, shared_wait = self.coordinator.claim(self.duration)
+                if not should_play:
+                    wait = int(shared_wait) + 1
+            
+            # Play tone
+            if should_play:
+                success = self.play_tone()
+                
+                if success:
+                    print(f"[{current_time.strftime('%H:%M:%S')}] ✅ Tone played")
+                    if self.coordinator:
+                        self.coordinator.commit(self.interval)
+                elif self.coordinator:
+                    self.coordinator.release()
             
             # Set next time
-            self.next_tone_time = current_time + timedelta(seconds=self.interval)
+            self.next_tone_time = current_time + timedelta(seconds=wait)
             
             # Wait (check every second for stop)
-            for _ in range(self.interval):
+            for _ in range(wait):
                 if not self.is_running:
                     break
                 time.sleep(1)
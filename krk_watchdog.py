@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+KRK Rokit Anti-Shutoff Resource Watchdog
+Optional long-run monitor for instances that stay up for weeks under launchd KeepAlive.
+
+Samples RSS, open file descriptors and thread count on a long interval, periodically records
+the top tracemalloc growth, writes everything to a small fixed-size ring-buffer file and
+restarts the process when a threshold stays exceeded.
+"""
+
+import fcntl
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+WATCHDOG_FILE = os.path.expanduser("~/.krk_anti_shutoff/watchdog.ring")
+
+# Ring buffer layout: SLOTS fixed-size text records, one JSON object per line
+SLOTS = 64
+SLOT_SIZE = 512
+
+
+def current_rss_mb():
+    """Returns the current resident set size in MB, or None if unavailable"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        pass
+    # macOS has no /proc; ps is cheap enough at watchdog intervals
+    try:
+        out = subprocess.run(["ps", "-o", "rss=", "-p", str(os.getpid())],
+                             capture_output=True, text=True, timeout=5).stdout
+        return int(out.strip()) / 1024
+    except (OSError, ValueError, subprocess.SubprocessError):
+        return None
+
+
+def open_fd_count():
+    """Returns the number of open file descriptors, or None if unavailable"""
+    for fd_dir in ("/proc/self/fd", "/dev/fd"):
+        try:
+            # listdir itself briefly holds one descriptor
+            return len(os.listdir(fd_dir)) - 1
+        except OSError:
+            continue
+    return None
+
+
+def restart_process():
+    """Replaces the current process with a fresh copy of itself"""
+    sys.stdout.flush()
+    sys.stderr.flush()
+    python = sys.executable
+    os.execl(python, python, *sys.argv)
+
+
+class RingBufferLog:
+    def __init__(self, path=WATCHDOG_FILE, slots=SLOTS, slot_size=SLOT_SIZE):
+        """
+        Args:
+            path (str): Ring buffer file (fixed size: slots * slot_size bytes), shared by all
+                        instances; every access holds an flock() on it
+            slots (int): Number of records kept
+            slot_size (int): Bytes per record, longer records are truncated
+        """
+        self.path = path
+        self.slots = slots
+        self.slot_size = slot_size
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._locked() as f:
+            if os.fstat(f.fileno()).st_size != slots * slot_size:
+                f.seek(0)
+                f.truncate()
+                f.write((b" " * (slot_size - 1) + b"\n") * slots)
+
+    @contextmanager
+    def _locked(self, shared=False):
+        """Opens the ring file (creating it if needed) and holds the cross-process lock"""
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        with os.fdopen(fd, "r+b") as f:
+            fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield f
+            finally:
+                f.flush()
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def _parse(self, data):
+        """Decodes slot contents into records ordered by sequence number"""
+        records = []
+        for i in range(self.slots):
+            line = data[i * self.slot_size:(i + 1) * self.slot_size].strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and isinstance(record.get("seq"), int):
+                records.append(record)
+        return sorted(records, key=lambda r: r["seq"])
+
+    def read(self):
+        """Returns stored records ordered by sequence number"""
+        with self._locked(shared=True) as f:
+            data = f.read()
+        return self._parse(data)
+
+    def append(self, record):
+        """Writes a record into the next slot, overwriting the oldest one"""
+        with self._locked() as f:
+            # Recompute the sequence under the lock so concurrent writers never share a slot
+            records = self._parse(f.read())
+            seq = records[-1]["seq"] + 1 if records else 0
+
+            record = dict(record, seq=seq)
+            line = json.dumps(record, separators=(",", ":")).encode()
+            if len(line) > self.slot_size - 1:
+                # Drop the bulky part rather than writing invalid JSON
+                record.pop("top", None)
+                record["truncated"] = True
+                line = json.dumps(record, separators=(",", ":")).encode()[:self.slot_size - 1]
+            line = line.ljust(self.slot_size - 1) + b"\n"
+
+            f.seek((seq % self.slots) * self.slot_size)
+            f.write(line)
+        return seq
+
+
+class ResourceWatchdog:
+    def __init__(self, interval=10*60, max_rss_mb=200, max_fds=256, max_threads=64,
+                 trace_every=6, top_n=5, strikes=2, path=WATCHDOG_FILE, on_restart=restart_process):
+        """
+        Args:
+            interval (int): Seconds between samples (10 min default)
+            max_rss_mb (float): RSS threshold in MB
+            max_fds (int): Open file descriptor threshold
+            max_threads (int): Python thread count threshold
+            trace_every (int): Record a tracemalloc diff every N samples (0 disables tracemalloc)
+            top_n (int): Number of tracemalloc entries kept per diff
+            strikes (int): Consecutive samples over threshold before restarting
+            path (str): Ring buffer file
+            on_restart (callable): Called when thresholds are exceeded (re-execs by default)
+        """
+        if interval < 1:
+            raise ValueError(f"Watchdog interval must be at least 1 second (got {interval})")
+        self.interval = interval
+        self.max_rss_mb = max_rss_mb
+        self.max_fds = max_fds
+        self.max_threads = max_threads
+        self.trace_every = trace_every
+        self.top_n = top_n
+        self.strikes = strikes
+        self.on_restart = on_restart
+        self.log = RingBufferLog(path)
+
+        self.samples = 0
+        self.over_count = 0
+        self.last_sizes = None
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self):
+        """Starts sampling in a daemon thread"""
+        if self.trace_every and not tracemalloc.is_tracing():
+            # A single frame keeps tracing overhead low
+            tracemalloc.start(1)
+        self.thread = threading.Thread(target=self.loop, name="krk-watchdog", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stops sampling"""
+        self.stop_event.set()
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join(timeout=2)
+
+    def loop(self):
+        """Sampling loop (sleeps on an event so stop() is immediate)"""
+        while not self.stop_event.wait(self.interval):
+            self.check()
+
+    def sample(self):
+        """Collects one resource sample"""
+        record = {
+            "t": int(time.time()),
+            "pid": os.getpid(),
+            "rss_mb": current_rss_mb(),
+            "fds": open_fd_count(),
+            "threads": threading.active_count(),
+        }
+        if tracemalloc.is_tracing():
+            # The watchdog's own tracing memory is excluded from the RSS limit
+            record["trace_mb"] = round(tracemalloc.get_tracemalloc_memory() / (1024 * 1024), 1)
+        if record["rss_mb"] is not None:
+            record["rss_mb"] = round(record["rss_mb"], 1)
+
+        self.samples += 1
+        if self.trace_every and tracemalloc.is_tracing() and self.samples % self.trace_every == 0:
+            record["top"] = self.trace_diff()
+        return record
+
+    def trace_diff(self):
+        """Returns the top allocation growth since the previous sample"""
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        # Keep only per-line totals between samples, not a second copy of every trace
+        sizes = {}
+        for stat in snapshot.statistics("lineno"):
+            frame = stat.traceback[0]
+            sizes[(frame.filename, frame.lineno)] = stat.size
+        del snapshot
+
+        previous, self.last_sizes = self.last_sizes, sizes
+        if previous is None:
+            previous = sizes
+        keys = set(sizes) | set(previous)
+        diffs = [(key, sizes.get(key, 0), sizes.get(key, 0) - previous.get(key, 0)) for key in keys]
+        diffs.sort(key=lambda d: (abs(d[2]), d[1]), reverse=True)
+        return [[f"{os.path.basename(filename)}:{lineno}", size // 1024, diff // 1024]
+                for (filename, lineno), size, diff in diffs[:self.top_n]]
+
+    def exceeded(self, record):
+        """Returns the names of thresholds the sample is over"""
+        values = dict(record)
+        if values["rss_mb"] is not None:
+            values["rss_mb"] -= values.get("trace_mb", 0)
+        limits = (("rss_mb", self.max_rss_mb), ("fds", self.max_fds), ("threads", self.max_threads))
+        return [name for name, limit in limits
+                if limit and values[name] is not None and values[name] > limit]
+
+    def check(self):
+        """Samples, records and restarts if thresholds stay exceeded"""
+        record = self.sample()
+        over = self.exceeded(record)
+        self.over_count = self.over_count + 1 if over else 0
+        if over:
+            record["over"] = over
+
+        restart = self.strikes and self.over_count >= self.strikes
+        if restart:
+            record["restart"] = True
+        self.log.append(record)
+
+        if restart:
+            print(f"[{time.strftime('%H:%M:%S')}] ♻️ Watchdog: {', '.join(over)} over limit, restarting...")
+            self.over_count = 0
+            self.on_restart()
+        return record